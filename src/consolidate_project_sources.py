@@ -12,16 +12,27 @@ Features:
 """
 
 import argparse
+import codecs
+import errno
 import fnmatch
+import functools
+import io
 import logging
 import mimetypes
+import mmap
 import os
 import re
 import subprocess
 import sys
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Mapping
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
 
 # Configure logging
 logging.basicConfig(
@@ -31,116 +42,162 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def _interned(values: Iterable[str]) -> frozenset[str]:
+    """Return an immutable set holding interned copies of ``values``."""
+    return frozenset(sys.intern(value) for value in values)
+
+
+def _glob_regex(patterns: Iterable[str]) -> "re.Pattern[str]":
+    """
+    Compile shell-style patterns into one regex matching any of them.
+
+    Args:
+        patterns: fnmatch-style patterns
+
+    Returns:
+        Compiled regex; with no patterns it never matches, where an empty
+        alternation would match every name
+    """
+    alternatives = [f"(?:{fnmatch.translate(p)})" for p in sorted(patterns)]
+    return re.compile("|".join(alternatives) or r"(?!)")
+
+
 # Project root - dynamically determined
 # Default to script's parent, but can be overridden.
 PROJECT_ROOT = Path(__file__).parent.absolute()
 
+# File name of this script, which never includes itself in the output
+SCRIPT_NAME = os.path.basename(__file__)
+
 # Output file pattern for gitignore
 OUTPUT_FILE_PATTERN = "*_merged_sources*.txt"
 OUTPUT_FILE_REGEX = re.compile(fnmatch.translate(OUTPUT_FILE_PATTERN))
 
 # Exclude patterns (directories and files to skip)
 # Note: Explicit list avoids accidentally excluding important dirs like .github
-EXCLUDE_DIRS: Set[str] = {
-    "venv",
-    ".venv",
-    "node_modules",
-    "__pycache__",
-    ".next",
-    "env",
-    ".git",
-    ".vscode",
-    ".idea",
-    "dist",
-    "build",
-    "coverage",
-    ".pytest_cache",
-    ".mypy_cache",
-    ".ruff_cache",
-    ".tox",
-    ".eggs",
-    "postgres_data",
-    "migrations/__pycache__",
-    "playwright-report",
-    "test-results",
-    ".turbo",
-    "temp",
-    "tmp",
-}
-
-EXCLUDE_FILES: Set[str] = {
-    ".DS_Store",
-    "Thumbs.db",
-    "*.pyc",
-    "*.pyo",
-    "*.pyd",
-    "*.so",
-    "*.dll",
-    "*.dylib",
-    "*.exe",
-    "*.log",
-    "*.pid",
-    "*.seed",
-    "*.pid.lock",
-    "package-lock.json",
-    "yarn.lock",
-    "pnpm-lock.yaml",
-    "*.min.js",
-    "*.min.css",
-    "*.map",
-}
-
-EXCLUDE_EXTENSIONS: Set[str] = {
-    ".pyc",
-    ".pyo",
-    ".pyd",
-    ".so",
-    ".dll",
-    ".dylib",
-    ".exe",
-    ".o",
-    ".a",
-    ".lib",
-    ".obj",
-    ".class",
-    ".jar",
-    ".war",
-    ".png",
-    ".jpg",
-    ".jpeg",
-    ".gif",
-    ".ico",
-    ".svg",
-    ".webp",
-    ".mp4",
-    ".avi",
-    ".mov",
-    ".wmv",
-    ".flv",
-    ".webm",
-    ".mp3",
-    ".wav",
-    ".ogg",
-    ".flac",
-    ".zip",
-    ".tar",
-    ".gz",
-    ".bz2",
-    ".7z",
-    ".rar",
-    ".pdf",
-    ".doc",
-    ".docx",
-    ".xls",
-    ".xlsx",
-    ".woff",
-    ".woff2",
-    ".ttf",
-    ".eot",
-    ".otf",
-    ".lock",
-    ".map",
-}
+EXCLUDE_DIRS: frozenset[str] = _interned(
+    {
+        "venv",
+        ".venv",
+        "node_modules",
+        "__pycache__",
+        ".next",
+        "env",
+        ".git",
+        ".vscode",
+        ".idea",
+        "dist",
+        "build",
+        "coverage",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".tox",
+        ".eggs",
+        "postgres_data",
+        "migrations/__pycache__",
+        "playwright-report",
+        "test-results",
+        ".turbo",
+        "temp",
+        "tmp",
+    }
+)
+
+# Entries containing a "/" are paths relative to the project root and can
+# only match there; the rest match a directory name at any depth
+_EXCLUDE_DIR_NAMES: frozenset[str] = _interned(
+    {d for d in EXCLUDE_DIRS if "/" not in d}
+)
+_EXCLUDE_DIR_RELPATHS: frozenset[str] = _interned(
+    EXCLUDE_DIRS - _EXCLUDE_DIR_NAMES
+)
+
+EXCLUDE_FILES: frozenset[str] = _interned(
+    {
+        ".DS_Store",
+        "Thumbs.db",
+        "*.pyc",
+        "*.pyo",
+        "*.pyd",
+        "*.so",
+        "*.dll",
+        "*.dylib",
+        "*.exe",
+        "*.log",
+        "*.pid",
+        "*.seed",
+        "*.pid.lock",
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "*.min.js",
+        "*.min.css",
+        "*.map",
+    }
+)
+
+# Plain EXCLUDE_FILES names are checked with a set lookup; only the glob
+# patterns are translated, once, into a single regex
+_EXCLUDE_FILE_NAMES: frozenset[str] = _interned(
+    {p for p in EXCLUDE_FILES if not any(c in p for c in "*?[")}
+)
+_EXCLUDE_FILE_RE = _glob_regex(EXCLUDE_FILES - _EXCLUDE_FILE_NAMES)
+
+EXCLUDE_EXTENSIONS: frozenset[str] = _interned(
+    {
+        ".pyc",
+        ".pyo",
+        ".pyd",
+        ".so",
+        ".dll",
+        ".dylib",
+        ".exe",
+        ".o",
+        ".a",
+        ".lib",
+        ".obj",
+        ".class",
+        ".jar",
+        ".war",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".ico",
+        ".svg",
+        ".webp",
+        ".mp4",
+        ".avi",
+        ".mov",
+        ".wmv",
+        ".flv",
+        ".webm",
+        ".mp3",
+        ".wav",
+        ".ogg",
+        ".flac",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".bz2",
+        ".7z",
+        ".rar",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".xls",
+        ".xlsx",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".eot",
+        ".otf",
+        ".lock",
+        ".map",
+    }
+)
 
 # Sensitive file patterns (check existence, don't include content)
 SENSITIVE_PATTERNS: List[str] = [
@@ -154,65 +211,148 @@ SENSITIVE_PATTERNS: List[str] = [
     r".*password.*",
 ]
 
+# SENSITIVE_PATTERNS combined into one case-insensitive regex. A leading or
+# trailing ".*" changes nothing for search() but makes it backtrack over the
+# rest of the path at every position, so those are dropped.
+_SENSITIVE_RE = re.compile(
+    "|".join(
+        f"(?:{p.removeprefix('.*').removesuffix('.*')})"
+        for p in SENSITIVE_PATTERNS
+    ),
+    re.IGNORECASE,
+)
+
+# Key names in .env files: "KEY=value" or "export KEY=value", one per line.
+# Matched on raw bytes so the file never needs decoding.
+_ENV_KEY_RE = re.compile(
+    rb"^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_.\-]*)[ \t]*=",
+    re.MULTILINE,
+)
+
+# Only this much of a .env file is scanned for key names (1 MiB)
+ENV_SCAN_MAX_BYTES: int = 1 << 20
+
 # Files to always include even if binary
-FORCE_INCLUDE_FILES: Set[str] = {
-    "Dockerfile",
-    "docker-compose.yml",
-    ".dockerignore",
-    ".gitignore",
-    ".gitattributes",
-    "requirements.txt",
-    "package.json",
-    "tsconfig.json",
-    "README.md",
-    "LICENSE",
-    "CHANGELOG.md",
-}
+FORCE_INCLUDE_FILES: frozenset[str] = _interned(
+    {
+        "Dockerfile",
+        "docker-compose.yml",
+        ".dockerignore",
+        ".gitignore",
+        ".gitattributes",
+        "requirements.txt",
+        "package.json",
+        "tsconfig.json",
+        "README.md",
+        "LICENSE",
+        "CHANGELOG.md",
+    }
+)
 
 # Maximum file size to include (10,000,000 bytes = 10 MB approx)
 # Use 10_000_000 to match test expectations
 MAX_FILE_SIZE: int = 10_000_000
 
+# Chunk size used when streaming file contents into the report (64 KiB)
+STREAM_CHUNK_SIZE: int = 1 << 16
+
+# Files larger than this are memory-mapped and copied to the output as
+# bytes instead of being decoded (64 KiB)
+MMAP_MIN_SIZE: int = 1 << 16
+
+# Files up to this size are read and rendered ahead by worker threads;
+# larger files take the memory-mapped path
+PREFETCH_MAX_SIZE: int = MMAP_MIN_SIZE
+
+# Maximum number of files read ahead of the writer at any time
+PREFETCH_WINDOW: int = 32
+
+# Directories are listed through open descriptors where the platform
+# supports it, so per-entry stat calls resolve names relative to them
+_SCANDIR_FD: bool = (
+    os.scandir in os.supports_fd and os.open in os.supports_dir_fd
+)
+_DIR_OPEN_FLAGS: int = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+# A descriptor stays open for every directory on the current walk path, so
+# only this many levels are opened that way; deeper levels, or all levels
+# once the process runs out of descriptors, are listed by path instead
+MAX_OPEN_DIR_FDS: int = 64
+
+# errno values meaning the process or system has no descriptors left
+_FD_EXHAUSTED = frozenset({errno.EMFILE, errno.ENFILE})
+
+# Section separators used throughout the report
+HEAVY_RULE = "=" * 80 + "\n"
+LIGHT_RULE = "-" * 80 + "\n"
+
+# Header written before each file's content, built once as bytes and filled
+# in with %-formatting: (path, path, language, line count, size)
+_FILE_HEADER_TEMPLATE = (
+    f"\n{LIGHT_RULE}FILE: %s\n{LIGHT_RULE}"
+    "Location:   %s\n"
+    "Language:   %s\n"
+    "Lines:      %d\n"
+    "Size:       %d bytes\n"
+    f"{LIGHT_RULE}\n"
+).encode()
+
+# Tree drawing glyphs, pre-encoded since tree lines are built as bytes:
+# connectors before an entry, and the prefix
+# continuing below it
+TREE_BRANCH = "├── ".encode()
+TREE_LAST = "└── ".encode()
+TREE_PIPE = "│   ".encode()
+TREE_SPACE = b"    "
+
+# Output buffer size, so the report is flushed in large writes (1 MiB)
+OUTPUT_BUFFER_SIZE: int = 1 << 20
+
 
 class GitInfoProvider:
     """Provides git repository information."""
 
     def __init__(self, project_root: Path):
         self.project_root = project_root
+        self._git_info: Optional[Dict[str, str]] = None
 
     def get_git_info(self) -> Dict[str, str]:
         """
         Get current git commit information.
 
+        The result is memoized, so git is only run once per provider.
+
         Returns:
             Dictionary with commit hash, date, and branch
         """
+        if self._git_info is None:
+            self._git_info = self._query_git_info()
+        return self._git_info
+
+    def _query_git_info(self) -> Dict[str, str]:
+        """Run git once and parse the commit information."""
         try:
-            commit_hash = subprocess.check_output(
-                ["git", "rev-parse", "HEAD"],
-                cwd=self.project_root,
+            # One git process instead of three: hash, date and ref names,
+            # separated by NUL bytes, which cannot occur in any of them
+            output = subprocess.check_output(
+                [
+                    "git",
+                    "-C",
+                    str(self.project_root),
+                    "log",
+                    "-1",
+                    "--pretty=format:%H%x00%cd%x00%D",
+                    "--date=iso",
+                ],
                 stderr=subprocess.PIPE,  # Capture errors for logging
                 text=True,
-            ).strip()
-
-            commit_date = subprocess.check_output(
-                ["git", "log", "-1", "--format=%cd", "--date=iso"],
-                cwd=self.project_root,
-                stderr=subprocess.PIPE,
-                text=True,
-            ).strip()
-
-            branch = subprocess.check_output(
-                ["git", "branch", "--show-current"],
-                cwd=self.project_root,
-                stderr=subprocess.PIPE,
-                text=True,
-            ).strip()
+            )
+            commit_hash, commit_date, refs = output.split("\x00")
 
             return {
                 "commit": commit_hash[:8],
                 "date": commit_date,
-                "branch": branch,
+                "branch": self._parse_branch(refs),
             }
         except subprocess.CalledProcessError as e:
             if e.stderr:
@@ -235,89 +375,290 @@ class GitInfoProvider:
                 "branch": "unknown",
             }
 
+    @staticmethod
+    def _parse_branch(refs: str) -> str:
+        """
+        Extract the current branch from git's %D ref-name list.
+
+        Args:
+            refs: Ref names such as "HEAD -> main, origin/main, tag: v1"
+
+        Returns:
+            Branch name, or an empty string for a detached HEAD (matching
+            ``git branch --show-current``)
+        """
+        for ref in refs.split(", "):
+            head, arrow, branch = ref.partition("HEAD -> ")
+            if arrow and not head:
+                return branch
+        return ""
+
+
+TEXT_EXTENSIONS: frozenset[str] = _interned(
+    {
+        ".txt",
+        ".md",
+        ".rst",
+        ".json",
+        ".yaml",
+        ".yml",
+        ".toml",
+        ".ini",
+        ".cfg",
+        ".conf",
+        ".config",
+        ".py",
+        ".js",
+        ".ts",
+        ".jsx",
+        ".tsx",
+        ".css",
+        ".scss",
+        ".html",
+        ".xml",
+        ".sql",
+        ".sh",
+        ".bash",
+        ".zsh",
+        ".go",
+        ".rs",
+        ".java",
+        ".c",
+        ".cpp",
+        ".h",
+        ".hpp",
+        ".rb",
+        ".php",
+        ".lua",
+        ".pl",
+        ".r",
+        ".m",
+        ".vim",
+        ".el",
+        ".clj",
+        ".ex",
+        ".exs",
+        ".Dockerfile",
+        ".gitignore",
+        ".dockerignore",
+    }
+)
+
+# Binary formats outside EXCLUDE_EXTENSIONS that is_text_file rejects
+# without opening the file
+BINARY_EXTENSIONS_STRICT: frozenset[str] = _interned(
+    {
+        ".bin",
+        ".db",
+        ".sqlite",
+        ".sqlite3",
+        ".pkl",
+        ".pickle",
+        ".npy",
+        ".npz",
+        ".parquet",
+        ".whl",
+        ".egg",
+        ".iso",
+        ".dmg",
+        ".img",
+        ".bmp",
+        ".tif",
+        ".tiff",
+        ".psd",
+        ".xz",
+        ".zst",
+        ".tgz",
+    }
+)
+
+# Number of leading bytes read when sniffing for binary content
+TEXT_SNIFF_SIZE: int = 8192
+
+# Control bytes that do not occur in text (everything below 0x20 except
+# tab, newline, vertical tab, form feed and carriage return); content
+# with more than BINARY_CONTROL_RATIO of them is treated as binary
+_CONTROL_BYTES = bytes(b for b in range(32) if b < 9 or 13 < b)
+BINARY_CONTROL_RATIO = 0.30
+
+# Read-only at runtime, so the shared tables cannot be changed by callers
+LANGUAGE_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        sys.intern(ext): sys.intern(language)
+        for ext, language in {
+            ".py": "Python",
+            ".js": "JavaScript",
+            ".ts": "TypeScript",
+            ".jsx": "React JSX",
+            ".tsx": "React TSX",
+            ".css": "CSS",
+            ".scss": "SCSS",
+            ".html": "HTML",
+            ".json": "JSON",
+            ".yaml": "YAML",
+            ".yml": "YAML",
+            ".toml": "TOML",
+            ".md": "Markdown",
+            ".sql": "SQL",
+            ".sh": "Shell",
+            ".bash": "Bash",
+            ".go": "Go",
+            ".rs": "Rust",
+            ".java": "Java",
+            ".c": "C",
+            ".cpp": "C++",
+            ".h": "C Header",
+            ".hpp": "C++ Header",
+        }.items()
+    }
+)
+
+# File names whose language does not follow from their extension
+SPECIAL_LANGUAGES: Mapping[str, str] = MappingProxyType(
+    {"Dockerfile": "Docker", "Makefile": "Makefile"}
+)
+
+
+def _ext(name: str) -> str:
+    """
+    Return the lower-cased extension of a file name, including the dot.
+
+    Plain string slicing avoids building a PurePath just to read .suffix.
+
+    Args:
+        name: File name (not a full path)
+
+    Returns:
+        Extension such as ".py", or an empty string if there is none
+    """
+    i = name.rfind(".")
+    if i < 0:
+        return ""
+    # Most extensions are already lower case; skip the copy for those
+    ext = name[i:]
+    return ext if ext.islower() else ext.lower()
+
+
+def _text_by_extension(ext: str) -> Optional[bool]:
+    """
+    Decide from the extension alone whether a file is text.
+
+    Args:
+        ext: Lower-cased extension including the dot
+
+    Returns:
+        True for known text extensions and text/* MIME types, False for
+        formats that are always binary, or None when only the content can
+        tell
+    """
+    if ext in TEXT_EXTENSIONS or _mime_is_text(ext):
+        return True
+    if ext in BINARY_EXTENSIONS_STRICT:
+        return False
+    return None
+
+
+def _looks_like_text(head: bytes) -> bool:
+    """
+    Sniff leading bytes for binary content.
+
+    A NUL byte means binary, as in git and grep, and so does a high share
+    of control bytes, as in file(1). Empty content counts as text.
+
+    Args:
+        head: Leading bytes of the file
+
+    Returns:
+        True if the bytes look like text, False otherwise
+    """
+    if b"\x00" in head:
+        return False
+    control = len(head) - len(head.translate(None, _CONTROL_BYTES))
+    return control <= len(head) * BINARY_CONTROL_RATIO
+
+
+@functools.lru_cache(maxsize=256)
+def _mime_is_text(ext: str) -> bool:
+    """
+    Check whether an extension's guessed MIME type is text/*.
+
+    mimetypes only looks at the suffix, so results are cached per
+    extension rather than recomputed for every file path.
+
+    Args:
+        ext: Lower-cased extension including the dot (e.g. ".csv")
+
+    Returns:
+        True if the MIME type is known and text, False otherwise
+    """
+    mime_type = mimetypes.guess_type("x" + ext)[0]
+    return mime_type is not None and mime_type.startswith("text")
+
+
+class Classification(NamedTuple):
+    """Outcome of classifying a single file during the walk."""
 
-TEXT_EXTENSIONS = {
-    ".txt",
-    ".md",
-    ".rst",
-    ".json",
-    ".yaml",
-    ".yml",
-    ".toml",
-    ".ini",
-    ".cfg",
-    ".conf",
-    ".config",
-    ".py",
-    ".js",
-    ".ts",
-    ".jsx",
-    ".tsx",
-    ".css",
-    ".scss",
-    ".html",
-    ".xml",
-    ".sql",
-    ".sh",
-    ".bash",
-    ".zsh",
-    ".go",
-    ".rs",
-    ".java",
-    ".c",
-    ".cpp",
-    ".h",
-    ".hpp",
-    ".rb",
-    ".php",
-    ".lua",
-    ".pl",
-    ".r",
-    ".m",
-    ".vim",
-    ".el",
-    ".clj",
-    ".ex",
-    ".exs",
-    ".Dockerfile",
-    ".gitignore",
-    ".dockerignore",
-}
-
-LANGUAGE_MAP = {
-    ".py": "Python",
-    ".js": "JavaScript",
-    ".ts": "TypeScript",
-    ".jsx": "React JSX",
-    ".tsx": "React TSX",
-    ".css": "CSS",
-    ".scss": "SCSS",
-    ".html": "HTML",
-    ".json": "JSON",
-    ".yaml": "YAML",
-    ".yml": "YAML",
-    ".toml": "TOML",
-    ".md": "Markdown",
-    ".sql": "SQL",
-    ".sh": "Shell",
-    ".bash": "Bash",
-    ".go": "Go",
-    ".rs": "Rust",
-    ".java": "Java",
-    ".c": "C",
-    ".cpp": "C++",
-    ".h": "C Header",
-    ".hpp": "C++ Header",
-}
+    included: bool
+    is_sensitive: bool
+    size: int
+    language: str
+
+
+# Shared result for files rejected before their size is known
+_EXCLUDED = Classification(False, False, 0, "")
+
+
+class Entry(NamedTuple):
+    """A file found by FileWalker.scan, with its classification."""
+
+    path: str
+    included: bool
+    is_sensitive: bool
+    size: int
+    language: str
 
 
 class FileWalker:
     """Handles walking the file system and applying exclusion logic."""
 
-    def __init__(self, project_root: Path):
+    def __init__(
+        self,
+        project_root: Path,
+        follow_symlinks: bool = False,
+        max_depth: Optional[int] = None,
+    ):
         self.project_root = project_root
+        self.follow_symlinks = follow_symlinks
+        # Deepest directory level to enter; the root's entries are level 1
+        self.max_depth = max_depth
+        # Load the MIME database before the walk rather than at import, so
+        # --help and argument errors do not pay for it
+        if not mimetypes.inited:
+            mimetypes.init()
+        # Every scanned path starts with this prefix, so relative paths
+        # are a plain slice instead of a Path.relative_to() call
+        self._root_prefix = os.path.join(str(project_root), "")
+        self._root_prefix_len = len(self._root_prefix)
+
+    def relative_path(self, path: str) -> str:
+        """
+        Return a scanned path relative to the project root.
+
+        Args:
+            path: Path string produced by the walk
 
-    def is_excluded_dir(self, dir_name: str) -> bool:
+        Returns:
+            The path with the project root prefix removed, or the path
+            unchanged if it lies outside the root
+        """
+        if path.startswith(self._root_prefix):
+            start = self._root_prefix_len
+            return path[start:]
+        return path
+
+    def is_excluded_dir(
+        self, dir_name: str, rel_path: Optional[str] = None
+    ) -> bool:
         """
         Check if directory should be excluded.
 
@@ -327,76 +668,210 @@ class FileWalker:
 
         Args:
             dir_name: Name of the directory to check
+            rel_path: Path of the directory relative to the project root,
+                      with "/" separators, to match path entries such as
+                      "migrations/__pycache__"
 
         Returns:
             True if directory should be excluded, False otherwise
         """
         # FIXED: Removed overly broad .startswith(".") check (Issue #4)
         # Now only excludes directories explicitly listed in EXCLUDE_DIRS
-        return dir_name in EXCLUDE_DIRS
+        return dir_name in _EXCLUDE_DIR_NAMES or (
+            rel_path is not None and rel_path in _EXCLUDE_DIR_RELPATHS
+        )
 
     def is_excluded_file(
         self,
-        file_path: Path,
+        file_path: Path | str | os.DirEntry,
         file_size: Optional[int] = None,
     ) -> bool:
         """
         Check if file should be excluded.
 
         Args:
-            file_path: Path to the file to check
+            file_path: Path to the file to check, or an os.DirEntry from a
+                       directory scan (its cached stat result is reused)
             file_size: Optional file size in bytes (to avoid redundant stat
                        calls)
 
         Returns:
             True if file should be excluded, False otherwise
         """
-        # Allow callers to pass a string filename for convenience in tests
-        if not isinstance(file_path, Path):
-            file_path = Path(file_path)
+        # A DirEntry already knows its stat result, so reuse it for the size
+        if isinstance(file_path, os.DirEntry):
+            entry = file_path
+            path, name = entry.path, entry.name
+            # Force-included files never need their size
+            if name in FORCE_INCLUDE_FILES:
+                return False
+            if file_size is None:
+                try:
+                    file_size = entry.stat(
+                        follow_symlinks=self.follow_symlinks
+                    ).st_size
+                except OSError as e:
+                    logger.error(f"Error accessing file {path}: {e}")
+                    return True
+        else:
+            # Paths are handled as strings; no Path object is built
+            path = os.fspath(file_path)
+            name = os.path.basename(path)
+
+        return self._is_excluded_file_str(path, name, _ext(name), file_size)
+
+    def _is_excluded_file_str(
+        self, path: str, name: str, ext: str, file_size: Optional[int]
+    ) -> bool:
+        """
+        String-only implementation of is_excluded_file.
+
+        Args:
+            path: Path to the file
+            name: File name
+            ext: Lower-cased extension of name, including the dot
+            file_size: File size in bytes, or None to stat the file
 
+        Returns:
+            True if file should be excluded, False otherwise
+        """
         # CRITICAL FIX: Force include certain files FIRST (Issue #1)
         # This must be checked before size limits or other exclusions.
-        if file_path.name in FORCE_INCLUDE_FILES:
+        if name in FORCE_INCLUDE_FILES:
             return False
 
-        # Check extension
-        if file_path.suffix.lower() in EXCLUDE_EXTENSIONS:
+        # A known size costs nothing to check, so oversized files are
+        # rejected before any other rule
+        if file_size is not None and self._exceeds_size_limit(path, file_size):
             return True
 
-        # Check filename patterns
-        for pattern in EXCLUDE_FILES:
-            if fnmatch.fnmatch(file_path.name, pattern):
-                return True
+        # Check extension and filename patterns
+        if self._is_excluded_name(name, ext):
+            return True
 
-        # Check file size (use provided size to avoid redundant stat calls)
+        # Check file size, if it was not provided
         if file_size is None:
-            # Prefer os.path.getsize for monkeypatching in tests
+            # A single stat; os.path.getsize is kept for monkeypatching in
+            # tests. Retrying with Path.stat would repeat the same failing
+            # syscall.
             try:
-                file_size = os.path.getsize(str(file_path))
-            except OSError:
-                try:
-                    file_size = file_path.stat().st_size
-                except OSError as e:
-                    logger.error(f"Error accessing file {file_path}: {e}")
-                    return True
+                file_size = os.path.getsize(path)
+            except OSError as e:
+                logger.error(f"Error accessing file {path}: {e}")
+                return True
+            if self._exceeds_size_limit(path, file_size):
+                return True
+
+        # Check if binary
+        return not self.is_text_file(path)
+
+    @staticmethod
+    def _is_excluded_name(name: str, ext: str) -> bool:
+        """
+        Check the name-only exclusion rules (extension and filename patterns).
+
+        Args:
+            name: File name
+            ext: Lower-cased file extension, including the leading dot
+
+        Returns:
+            True if the name alone excludes the file, False otherwise
+        """
+        if ext in EXCLUDE_EXTENSIONS or name in _EXCLUDE_FILE_NAMES:
+            return True
+
+        return _EXCLUDE_FILE_RE.match(name) is not None
+
+    def _exceeds_size_limit(self, path: str, file_size: int) -> bool:
+        """
+        Check a file size against MAX_FILE_SIZE, logging when it is exceeded.
+
+        Args:
+            path: Path to the file (used for logging)
+            file_size: File size in bytes
 
+        Returns:
+            True if the file is too large to include, False otherwise
+        """
         if file_size >= MAX_FILE_SIZE:
             log_msg = "File %s exceeds size limit (%s bytes), excluding"
             logger.warning(
                 log_msg,
-                file_path.relative_to(self.project_root),
+                self.relative_path(path),
                 f"{file_size:,}",
             )
             return True
+        return False
 
-        # Check if binary
-        if not self.is_text_file(file_path):
-            return True
+    def classify(
+        self, entry: os.DirEntry, path: Optional[str] = None
+    ) -> Classification:
+        """
+        Classify a directory entry in a single pass.
 
-        return False
+        Checks run cheapest first: name and extension rules, then the
+        sensitive-file patterns, then the size from the entry's cached stat
+        result. The text probe runs last and is skipped for known text
+        extensions. Sensitive files go through the same checks as
+        is_excluded_file, so binary ones are excluded rather than listed.
+
+        Args:
+            entry: Directory entry of the file to classify
+            path: Full path of the file, for entries listed from a directory
+                  descriptor (defaults to entry.path)
 
-    def is_text_file(self, file_path: Path) -> bool:
+        Returns:
+            Classification with the inclusion decision, sensitivity, size
+            and detected language
+        """
+        name = entry.name
+        if path is None:
+            path = entry.path
+        ext = _ext(name)
+
+        # Force-included files skip every exclusion rule (Issue #1)
+        forced = name in FORCE_INCLUDE_FILES
+        if not forced and self._is_excluded_name(name, ext):
+            return _EXCLUDED
+
+        # Only the part of the path inside the project counts; a project
+        # kept under e.g. ~/secrets/ must not make every file sensitive
+        is_sensitive = self.is_sensitive_file(self.relative_path(path))
+
+        try:
+            size = entry.stat(follow_symlinks=self.follow_symlinks).st_size
+        except OSError as e:
+            logger.error(f"Error accessing file {path}: {e}")
+            return _EXCLUDED
+
+        if not forced:
+            if self._exceeds_size_limit(path, size):
+                return Classification(False, is_sensitive, size, "")
+            is_text = _text_by_extension(ext)
+            if is_text is None:
+                head = self._read_head(path)
+                is_text = head is not None and _looks_like_text(head)
+            if not is_text:
+                return Classification(False, is_sensitive, size, "")
+
+        # Same lookup as get_file_language, reusing the extension from above
+        language = SPECIAL_LANGUAGES.get(name) or LANGUAGE_MAP.get(ext, "Text")
+        return Classification(True, is_sensitive, size, language)
+
+    @staticmethod
+    def is_sensitive_file(file_path: Path | str) -> bool:
+        """
+        Check if file contains sensitive information.
+
+        Args:
+            file_path: Path to the file to check
+
+        Returns:
+            True if file is sensitive, False otherwise
+        """
+        return _SENSITIVE_RE.search(str(file_path)) is not None
+
+    def is_text_file(self, file_path: Path | str) -> bool:
         """
         Check if file is text (not binary).
 
@@ -406,26 +881,38 @@ class FileWalker:
         Returns:
             True if file is text, False otherwise
         """
+        path = os.fspath(file_path)
+        name = os.path.basename(path)
+
         # Force include certain files
-        if file_path.name in FORCE_INCLUDE_FILES:
+        if name in FORCE_INCLUDE_FILES:
             return True
 
-        # Check by mime type
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        if mime_type and mime_type.startswith("text"):
-            return True
+        # Decide by extension where possible, otherwise sniff the content
+        is_text = _text_by_extension(_ext(name))
+        if is_text is not None:
+            return is_text
 
-        # Check by extension
-        if file_path.suffix.lower() in TEXT_EXTENSIONS:
-            return True
+        head = self._read_head(path)
+        return head is not None and _looks_like_text(head)
 
-        # Try to read as text
+    @staticmethod
+    def _read_head(path: str) -> Optional[bytes]:
+        """
+        Read the leading bytes of a file for the text probe.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Up to TEXT_SNIFF_SIZE bytes, or None if the file can't be read
+        """
         try:
-            with open(file_path, encoding="utf-8") as f:
-                f.read(512)  # Read first 512 bytes
-            return True
-        except (OSError, UnicodeDecodeError):
-            return False
+            with open(path, "rb") as f:
+                return f.read(TEXT_SNIFF_SIZE)
+        except OSError as e:
+            logger.warning(f"Cannot read {path}: {e}")
+            return None
 
     @staticmethod
     def get_file_language(file_path: Path | str) -> str:
@@ -439,64 +926,350 @@ class FileWalker:
             Detected language/type as string
         """
         # Accept either a Path or string
-        if not isinstance(file_path, Path):
-            name = str(file_path)
-            ext = Path(name).suffix.lower()
-        else:
-            ext = file_path.suffix.lower()
-            name = file_path.name
+        name = os.path.basename(file_path)
+        return SPECIAL_LANGUAGES.get(name) or LANGUAGE_MAP.get(
+            _ext(name), "Text"
+        )
 
-        # Special-case known filenames
-        if name == "Dockerfile":
-            return "Docker"
+    def scan(
+        self, write_line: Optional[Callable[[bytes], object]] = None
+    ) -> Tuple[List[bytes], List[Entry]]:
+        """
+        Walk the project once, producing both the tree and the file list.
 
-        # Default to 'Text' for unknown text-like files
-        return LANGUAGE_MAP.get(ext, "Text")
+        Each directory is listed with a single os.scandir call, and every
+        file is classified as it is found, so the tree and the source
+        files section no longer walk the project separately. The walk is
+        depth-first over an explicit stack, so deep trees cannot hit the
+        interpreter's recursion limit.
 
-    def build_file_tree(self, directory: Path, prefix: str = "") -> List[str]:
+        Args:
+            write_line: Callable receiving each tree line as it is produced,
+                        e.g. the report's write method, to stream the tree
+                        instead of holding it in memory
+
+        Returns:
+            Tuple of (newline-terminated UTF-8 tree lines, entries). Tree
+            lines are empty when write_line is given. Entries cover every
+            file found, included or not, with the files of a directory
+            listed before those of its subdirectories.
         """
-        Build a visual tree structure of the project.
+        root = str(self.project_root)
+        tree_lines: List[bytes] = []
+        entries: List[Entry] = []
+        join = os.path.join
+        emit = tree_lines.append if write_line is None else write_line
+        max_depth = self.max_depth
+
+        # Followed symlinks can form loops; remember each directory's
+        # (device, inode) so it is only scanned once
+        visited = None
+        if self.follow_symlinks:
+            root_stat = os.stat(root)
+            visited = {(root_stat.st_dev, root_stat.st_ino)}
+
+        root_fd = None
+        if _SCANDIR_FD:
+            try:
+                root_fd = os.open(root, _DIR_OPEN_FLAGS)
+            except PermissionError as e:
+                logger.warning(f"Permission denied accessing {root}: {e}")
+                return tree_lines, entries
+            except OSError as e:
+                if e.errno not in _FD_EXHAUSTED:
+                    logger.warning(f"Cannot list {root}: {e}")
+                    return tree_lines, entries
+
+        # Stack frames are (directory, descriptor, subdirectories still to
+        # visit, file lines). A directory's file lines are written once all
+        # of its subdirectories are done, after their subtrees.
+        stack = [
+            (
+                root,
+                root_fd,
+                *self._scan_dir(root, b"", entries, visited, root_fd),
+            )
+        ]
+        try:
+            while stack:
+                directory, dir_fd, subdirs, file_lines = stack[-1]
+                if not subdirs:
+                    stack.pop()
+                    for line in file_lines:
+                        emit(line)
+                    if dir_fd is not None:
+                        os.close(dir_fd)
+                    continue
+
+                name, line, sub_prefix = subdirs.pop()
+                emit(line)
+                # Directories past max_depth are listed but never opened
+                if max_depth is not None and len(stack) >= max_depth:
+                    continue
+                sub_path = join(directory, name)
+                sub_fd = None
+                if dir_fd is not None and len(stack) < MAX_OPEN_DIR_FDS:
+                    try:
+                        sub_fd = os.open(name, _DIR_OPEN_FLAGS, dir_fd=dir_fd)
+                    except PermissionError as e:
+                        logger.warning(
+                            f"Permission denied accessing {sub_path}: {e}"
+                        )
+                        continue
+                    except OSError as e:
+                        # Out of descriptors: list this subtree by path
+                        if e.errno not in _FD_EXHAUSTED:
+                            logger.warning(f"Cannot list {sub_path}: {e}")
+                            continue
+                stack.append(
+                    (
+                        sub_path,
+                        sub_fd,
+                        *self._scan_dir(
+                            sub_path, sub_prefix, entries, visited, sub_fd
+                        ),
+                    )
+                )
+        finally:
+            # Only reached with a non-empty stack if the walk was interrupted
+            for _, dir_fd, _, _ in stack:
+                if dir_fd is not None:
+                    os.close(dir_fd)
+
+        return tree_lines, entries
+
+    def _scan_dir(
+        self,
+        directory: str,
+        prefix: bytes,
+        entries: List[Entry],
+        visited: Optional[Set[Tuple[int, int]]],
+        dir_fd: Optional[int] = None,
+    ) -> Tuple[List[Tuple[str, str, str]], List[str]]:
+        """
+        List one directory and classify its files.
+
+        When dir_fd is given, the directory is listed through it (and scan
+        opens subdirectories relative to it), so the stat calls made while
+        classifying entries resolve a single name in the kernel instead of
+        the full path.
 
         Args:
-            directory: Directory to build tree from
+            directory: Directory to scan
             prefix: Current line prefix for tree formatting
+            entries: File entries, appended to in place
+            visited: (device, inode) of directories already scanned, or
+                     None when symlinks are not followed
+            dir_fd: Open descriptor of directory, or None to scan by path
 
         Returns:
-            List of tree lines
+            Tuple of (subdirectories, file lines). Subdirectories are
+            (name, tree line, child prefix) tuples in reverse order, ready
+            to be popped; file lines are the newline-terminated tree lines
+            of the included files. Lines and prefixes are UTF-8 bytes.
         """
-        tree_lines = []
-
         try:
-            items = sorted(
-                directory.iterdir(), key=lambda x: (not x.is_dir(), x.name)
-            )
-            items = [
-                item for item in items if not self.is_excluded_dir(item.name)
-            ]
-
-            for i, item in enumerate(items):
-                is_last_item = i == len(items) - 1
-
-                # Tree characters
-                connector = "└── " if is_last_item else "├── "
-                extension = "    " if is_last_item else "│   "
-
-                # Add item
-                if item.is_dir():
-                    tree_lines.append(f"{prefix}{connector}{item.name}/")
-                    # Recurse into directory
-                    sub_tree = self.build_file_tree(item, prefix + extension)
-                    tree_lines.extend(sub_tree)
-                elif not self.is_excluded_file(item):
-                    tree_lines.append(f"{prefix}{connector}{item.name}")
+            with os.scandir(directory if dir_fd is None else dir_fd) as it:
+                items = sorted(it, key=lambda e: e.name)
         except PermissionError as e:
             logger.warning(f"Permission denied accessing {directory}: {e}")
+            return [], []
+        except OSError as e:
+            logger.warning(f"Cannot list {directory}: {e}")
+            return [], []
+
+        follow = self.follow_symlinks
+        is_excluded_dir = self.is_excluded_dir
+        classify = self.classify
+        add_entry = entries.append
+        join = os.path.join
+        # Root-relative prefix of this directory's entries ("" at the root),
+        # for the path entries of EXCLUDE_DIRS
+        rel_dir = self.relative_path(join(directory, ""))
+        if os.sep != "/":
+            rel_dir = rel_dir.replace(os.sep, "/")
+        subdir_names = []
+        file_names = []
+        for item in items:
+            # Symlinks are skipped unless following them was requested;
+            # the check uses the type from the directory listing
+            if not follow and item.is_symlink():
+                continue
+
+            if item.is_dir(follow_symlinks=follow):
+                if is_excluded_dir(item.name, rel_dir + item.name):
+                    continue
+                if visited is not None:
+                    try:
+                        dir_stat = item.stat()
+                    except OSError:
+                        continue
+                    key = (dir_stat.st_dev, dir_stat.st_ino)
+                    if key in visited:
+                        continue
+                    visited.add(key)
+                subdir_names.append(item.name)
+            elif item.is_file(follow_symlinks=follow):
+                # Entries listed from a descriptor carry only their name
+                path = join(directory, item.name)
+                classification = classify(item, path)
+                add_entry(Entry(path, *classification))
+                if classification.included:
+                    file_names.append(item.name)
+
+        # Directories are listed first in the tree, then files
+        last_index = len(subdir_names) + len(file_names) - 1
+        subdirs = []
+        for i, name in enumerate(subdir_names):
+            is_last_item = i == last_index
+            connector = TREE_LAST if is_last_item else TREE_BRANCH
+            extension = TREE_SPACE if is_last_item else TREE_PIPE
+            line = b"".join((prefix, connector, name.encode(), b"/\n"))
+            subdirs.append((name, line, prefix + extension))
+        subdirs.reverse()
+
+        file_lines = []
+        for i, name in enumerate(file_names, start=len(subdir_names)):
+            connector = TREE_LAST if i == last_index else TREE_BRANCH
+            file_lines.append(
+                b"".join((prefix, connector, name.encode(), b"\n"))
+            )
+
+        return subdirs, file_lines
 
+    def build_file_tree(
+        self, directory: Path, prefix: str = ""
+    ) -> List[bytes]:
+        """
+        Build a visual tree structure of a directory.
+
+        Kept for callers that only need the tree; it runs the same single
+        pass as scan, which the consolidator uses to get the tree and the
+        file list together.
+
+        Args:
+            directory: Directory to build tree from
+            prefix: Line prefix for tree formatting
+
+        Returns:
+            List of newline-terminated tree lines, encoded as UTF-8
+        """
+        walker = self
+        if Path(directory) != self.project_root:
+            walker = FileWalker(
+                Path(directory), self.follow_symlinks, self.max_depth
+            )
+        tree_lines, _ = walker.scan()
+        if prefix:
+            encoded = prefix.encode()
+            tree_lines = [encoded + line for line in tree_lines]
         return tree_lines
 
 
+def _count_lines(source) -> int:
+    """
+    Count the lines of a binary stream without loading it into memory.
+
+    Reads fixed-size chunks and counts line breaks with bytes.count, as
+    universal newlines translate them when the content is written: LF, CRLF
+    and a lone CR each end a line. A final line without a line break counts
+    as a line; an empty file has none.
+
+    Args:
+        source: Binary file object positioned at the start of the content
+
+    Returns:
+        Number of lines
+    """
+    newlines = 0
+    last_chunk = b""
+    while chunk := source.read(STREAM_CHUNK_SIZE):
+        newlines += (
+            chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+        )
+        # A "\r\n" split across two chunks was counted twice
+        if last_chunk.endswith(b"\r") and chunk.startswith(b"\n"):
+            newlines -= 1
+        last_chunk = chunk
+    if last_chunk and not last_chunk.endswith((b"\n", b"\r")):
+        newlines += 1
+    return newlines
+
+
+def _plain_utf8_line_count(data) -> Optional[int]:
+    """
+    Count the lines of a buffer that can be copied to the report as is.
+
+    That holds when it is valid UTF-8 without carriage returns, i.e. when
+    decoding it with universal newlines would give back the same text.
+    The buffer is validated and counted one chunk at a time, so no
+    full-size copy or string is allocated.
+
+    Args:
+        data: Bytes-like object supporting slicing, such as an mmap
+
+    Returns:
+        Number of lines, counted as in _count_lines, or None if the
+        content must be decoded
+    """
+    if data.find(b"\r") != -1:
+        return None
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    newlines = 0
+    try:
+        for start in range(0, len(data), STREAM_CHUNK_SIZE):
+            end = start + STREAM_CHUNK_SIZE
+            chunk = data[start:end]
+            newlines += chunk.count(b"\n")
+            decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return None
+    if len(data) and data[-1:] != b"\n":
+        newlines += 1
+    return newlines
+
+
+def _read_file(file_path: str, size: int) -> bytes:
+    """
+    Read a whole file whose size is known from the walk.
+
+    Asks for size + 1 bytes with os.read on a raw descriptor, so a file
+    that did not change usually costs a single read syscall, without the
+    fstat and buffering of open().read(). Otherwise the read was short
+    (os.read may return fewer bytes than asked for, e.g. on network
+    filesystems) or the file changed since the walk, and it is read on
+    to end of file.
+
+    Args:
+        file_path: Path to the file
+        size: File size from the walk
+
+    Returns:
+        File content
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, size + 1)
+        if len(data) == size:
+            return data
+        parts = [data]
+        total = len(data)
+        while chunk := os.read(fd, max(size + 1 - total, STREAM_CHUNK_SIZE)):
+            parts.append(chunk)
+            total += len(chunk)
+        return b"".join(parts)
+    finally:
+        os.close(fd)
+
+
 class ReportGenerator:
-    """Generates the final consolidated text report."""
+    """
+    Generates the final consolidated text report.
+
+    Writers take a binary output stream; each section is formatted as one
+    string and encoded to UTF-8 in a single write.
+    """
 
     def __init__(self, project_root: Path):
         self.project_root = project_root
@@ -505,202 +1278,243 @@ class ReportGenerator:
         self, out, timestamp: datetime, git_info: Dict[str, str]
     ) -> None:
         """Write file header."""
-        out.write("=" * 80 + "\n")
-        out.write("PROJECT SOURCE CODE CONSOLIDATION\n")
-        out.write("=" * 80 + "\n\n")
-
-        out.write("Project:          Talos Algo AI\n")
         time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        out.write(f"Consolidation:    {time_str}\n")
-        out.write(f"Git Commit:       {git_info['commit']}\n")
-        out.write(f"Git Branch:       {git_info['branch']}\n")
-        out.write(f"Commit Date:      {git_info['date']}\n")
-        out.write(f"Project Root:     {self.project_root}\n")
-
-        out.write("\n" + "=" * 80 + "\n")
-        out.write("PURPOSE\n")
-        out.write("=" * 80 + "\n\n")
         out.write(
+            f"{HEAVY_RULE}PROJECT SOURCE CODE CONSOLIDATION\n{HEAVY_RULE}\n"
+            "Project:          Talos Algo AI\n"
+            f"Consolidation:    {time_str}\n"
+            f"Git Commit:       {git_info['commit']}\n"
+            f"Git Branch:       {git_info['branch']}\n"
+            f"Commit Date:      {git_info['date']}\n"
+            f"Project Root:     {self.project_root}\n"
+            f"\n{HEAVY_RULE}PURPOSE\n{HEAVY_RULE}\n"
             "This file contains a complete consolidation of the project "
             "source code,\nconfiguration files, and documentation for "
             "auditing and reproduction purposes.\n"
-        )
-        out.write("\n")
-        out.write("Exclusions:\n")
-        out.write("  - Binary files (images, compiled code, executables)\n")
-        out.write("  - Dependencies (node_modules, venv, etc.)\n")
-        out.write("  - Generated files (.next, dist, build)\n")
-        out.write("  - Cache and temporary files\n")
-        out.write("  - Large files (> 10 MB)\n")
-        out.write("\n")
-        out.write(
+            "\n"
+            "Exclusions:\n"
+            "  - Binary files (images, compiled code, executables)\n"
+            "  - Dependencies (node_modules, venv, etc.)\n"
+            "  - Generated files (.next, dist, build)\n"
+            "  - Cache and temporary files\n"
+            "  - Large files (> 10 MB)\n"
+            "\n"
             "Sensitive files are listed with metadata but "
             "content is not included.\n"
+            "\n".encode()
         )
-        out.write("\n")
 
-    def write_file_tree(self, out, tree_lines: List[str]) -> None:
+    def write_file_tree(self, out, tree_lines: List[bytes]) -> None:
         """Write project file tree."""
-        out.write("=" * 80 + "\n")
-        out.write("PROJECT STRUCTURE\n")
-        out.write("=" * 80 + "\n\n")
+        self.write_file_tree_header(out)
+        out.write(b"".join(tree_lines))
+        self.write_file_tree_footer(out)
 
-        out.write(f"{self.project_root.name}/\n")
-        for line in tree_lines:
-            out.write(line + "\n")
+    def write_file_tree_header(self, out) -> None:
+        """Write the file tree heading, up to the root directory line."""
+        out.write(
+            f"{HEAVY_RULE}PROJECT STRUCTURE\n{HEAVY_RULE}\n"
+            f"{self.project_root.name}/\n".encode()
+        )
 
-        out.write("\n")
+    def write_file_tree_footer(self, out) -> None:
+        """Write the blank line closing the file tree."""
+        out.write(b"\n")
 
     def write_source_files_header(self, out) -> None:
         """Writes the header for the source files section."""
-        out.write("=" * 80 + "\n")
-        out.write("SOURCE FILES\n")
-        out.write("=" * 80 + "\n\n")
+        out.write(f"{HEAVY_RULE}SOURCE FILES\n{HEAVY_RULE}\n".encode())
 
     def write_sensitive_file(
         self,
         out,
-        file_path: Path,
-        file_stat: os.stat_result,
+        rel_path: str,
+        file_size: int,
         info: Dict,
         language: str,
     ) -> None:
         """Write sensitive file metadata without content."""
-        rel_path = file_path.relative_to(self.project_root)
-
-        out.write("\n" + "-" * 80 + "\n")
-        out.write(f"FILE: {rel_path}\n")
-        out.write("-" * 80 + "\n")
-        out.write("Type:      SENSITIVE (content not included)\n")
-        out.write(f"Location:  {rel_path}\n")
-        out.write(f"Size:      {file_stat.st_size} bytes\n")
-        out.write(f"Language:  {language}\n")
+        block = (
+            f"\n{LIGHT_RULE}FILE: {rel_path}\n{LIGHT_RULE}"
+            "Type:      SENSITIVE (content not included)\n"
+            f"Location:  {rel_path}\n"
+            f"Size:      {file_size} bytes\n"
+            f"Language:  {language}\n"
+        )
 
         if "keys" in info:
-            out.write("\nEnvironment Variables:\n")
-            for key in info["keys"]:
-                out.write(f"  {key}\n")
+            block += "\nEnvironment Variables:\n" + "".join(
+                f"  {key}\n" for key in info["keys"]
+            )
 
-        out.write("\nNOTE: This is a sensitive file. ")
-        out.write("Content is not included for security.\n")
-        out.write(
-            "      The file exists and should be " "configured separately.\n"
+        block += (
+            "\nNOTE: This is a sensitive file. "
+            "Content is not included for security.\n"
+            "      The file exists and should be configured separately.\n"
+            "\n"
         )
-        out.write("\n")
+        out.write(block.encode())
 
         logger.info(f"🔒 Sensitive: {rel_path}")
 
     def write_regular_file(
         self,
         out,
-        file_path: Path,
-        file_stat: os.stat_result,
-        content: str,
+        rel_path: str,
+        file_size: int,
+        source,
         line_count: int,
         language: str,
     ) -> None:
-        """Write regular file with content."""
-        rel_path = file_path.relative_to(self.project_root)
+        """Write regular file, streaming its content from a text stream."""
+        out.write(self._file_header(rel_path, file_size, line_count, language))
 
-        out.write("\n" + "-" * 80 + "\n")
-        out.write(f"FILE: {rel_path}\n")
-        out.write("-" * 80 + "\n")
-        out.write(f"Location:   {rel_path}\n")
-        out.write(f"Language:   {language}\n")
-        out.write(f"Lines:      {line_count}\n")
-        out.write(f"Size:       {file_stat.st_size} bytes\n")
-        out.write("-" * 80 + "\n\n")
+        last_chunk = ""
+        while chunk := source.read(STREAM_CHUNK_SIZE):
+            out.write(chunk.encode())
+            last_chunk = chunk
 
-        out.write(content)
+        # Terminate the content's last line if needed, then a blank line
+        out.write(b"\n" if last_chunk.endswith("\n") else b"\n\n")
 
-        if not content.endswith("\n"):
-            out.write("\n")
+        logger.debug(f"✓ Included: {rel_path} ({line_count} lines)")
+
+    def render_regular_file(
+        self, rel_path: str, file_size: int, content: bytes, language: str
+    ) -> Tuple[List[bytes], int]:
+        """
+        Render a regular file held in memory (run on prefetch worker threads).
 
-        out.write("\n")
+        Plain UTF-8 content is used as is; anything else is decoded with
+        replacement characters and universal newlines, as when streaming.
+
+        Returns:
+            Tuple of (encoded parts to write in order, line count)
+        """
+        line_count = _plain_utf8_line_count(content)
+        if line_count is None:
+            line_count = _count_lines(io.BytesIO(content))
+            with io.TextIOWrapper(
+                io.BytesIO(content), encoding="utf-8", errors="replace"
+            ) as source:
+                content = source.read().encode()
+
+        trailer = b"\n" if content.endswith(b"\n") else b"\n\n"
+        header = self._file_header(rel_path, file_size, line_count, language)
+        return [header, content, trailer], line_count
+
+    def write_rendered_file(
+        self, out, rel_path: str, parts: List[bytes], line_count: int
+    ) -> None:
+        """Write a regular file rendered by render_regular_file."""
+        out.writelines(parts)
 
         logger.debug(f"✓ Included: {rel_path} ({line_count} lines)")
 
-    def write_error(self, out, rel_path: Path, error: Exception) -> None:
+    def write_raw_file(
+        self,
+        out,
+        rel_path: str,
+        file_size: int,
+        data,
+        line_count: int,
+        language: str,
+    ) -> None:
+        """
+        Write regular file, copying its raw bytes to the output.
+
+        The caller must have checked the content with _plain_utf8_line_count,
+        so the bytes match what write_regular_file would produce.
+        """
+        out.write(self._file_header(rel_path, file_size, line_count, language))
+        out.write(data)
+        out.write(b"\n" if data[-1:] == b"\n" else b"\n\n")
+
+        logger.debug(f"✓ Included: {rel_path} ({line_count} lines)")
+
+    @staticmethod
+    def _file_header(
+        rel_path: str, file_size: int, line_count: int, language: str
+    ) -> bytes:
+        """Format the encoded header block written before a file's content."""
+        path = rel_path.encode()
+        return _FILE_HEADER_TEMPLATE % (
+            path,
+            path,
+            language.encode(),
+            line_count,
+            file_size,
+        )
+
+    def write_error(self, out, rel_path: str, error: Exception) -> None:
         """Writes an error message for a file that couldn't be read."""
-        out.write(f"\nERROR: Unable to read file: {error}\n\n")
+        out.write(f"\nERROR: Unable to read file: {error}\n\n".encode())
         logger.error(f"✗ Error reading {rel_path}: {error}")
 
     def write_statistics(self, out, timestamp: datetime, stats: Dict) -> None:
         """Write consolidation statistics."""
-        out.write("=" * 80 + "\n")
-        out.write("CONSOLIDATION STATISTICS\n")
-        out.write("=" * 80 + "\n\n")
+        sorted_langs = Counter(stats["languages"]).most_common()
+        lang_lines = "".join(
+            f"  {lang:20s} {count:4d} files\n" for lang, count in sorted_langs
+        )
 
         out.write(
+            f"{HEAVY_RULE}CONSOLIDATION STATISTICS\n{HEAVY_RULE}\n"
             f"Completion Time: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Total Files Scanned: {stats['total_files']}\n"
+            f"Files Included: {stats['included_files']}\n"
+            f"Files Excluded: {stats['excluded_files']}\n"
+            f"Sensitive Files: {stats['sensitive_files']}\n"
+            f"Total Lines of Code: {stats['total_lines']:,}\n"
+            "\n"
+            "Language Distribution:\n"
+            f"{lang_lines}"
+            "\n"
+            f"{HEAVY_RULE}END OF CONSOLIDATION\n{HEAVY_RULE}".encode()
         )
-        out.write(f"Total Files Scanned: {stats['total_files']}\n")
-        out.write(f"Files Included: {stats['included_files']}\n")
-        out.write(f"Files Excluded: {stats['excluded_files']}\n")
-        out.write(f"Sensitive Files: {stats['sensitive_files']}\n")
-        out.write(f"Total Lines of Code: {stats['total_lines']:,}\n")
-        out.write("\n")
-
-        out.write("Language Distribution:\n")
-        sorted_langs = sorted(
-            stats["languages"].items(), key=lambda x: x[1], reverse=True
-        )
-        for lang, count in sorted_langs:
-            out.write(f"  {lang:20s} {count:4d} files\n")
-
-        out.write("\n")
-        out.write("=" * 80 + "\n")
-        out.write("END OF CONSOLIDATION\n")
-        out.write("=" * 80 + "\n")
 
 
 class ProjectConsolidator:
     """Consolidates project source code into a single auditable file."""
 
-    def __init__(self, project_root: Path, list_env_keys: bool = True) -> None:
+    def __init__(
+        self,
+        project_root: Path,
+        list_env_keys: bool = True,
+        follow_symlinks: bool = False,
+        max_depth: Optional[int] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> None:
         """
         Initialize the consolidator.
 
         Args:
             project_root: Root directory of the project to consolidate
             list_env_keys: Whether to list environment variable keys in output
+            follow_symlinks: Whether to follow symbolic links while walking
+            max_depth: Deepest directory level to walk, or None for no limit
+            timestamp: Time of the run, shared with the output file name;
+                       taken when consolidation starts if not given
         """
         self.project_root = project_root
         self.list_env_keys = list_env_keys
+        self.timestamp = timestamp
         self.stats: Dict[str, int | Dict[str, int]] = {
             "total_files": 0,
             "included_files": 0,
             "excluded_files": 0,
             "sensitive_files": 0,
             "total_lines": 0,
-            "languages": {},
+            "languages": Counter(),
         }
         self.file_tree: List[str] = []
-        # Cache for file stats to avoid redundant stat() calls (Issue #3)
-        self._file_stats_cache: Dict[Path, os.stat_result] = {}
         self._output_file: Optional[Path] = None
         self.report_generator = ReportGenerator(self.project_root)
-        self.file_walker = FileWalker(self.project_root)
+        self.file_walker = FileWalker(
+            self.project_root, follow_symlinks, max_depth
+        )
         self.git_info_provider = GitInfoProvider(self.project_root)
 
-    def _get_file_stat(self, file_path: Path) -> Optional[os.stat_result]:
-        """
-        Get file stat with caching to avoid redundant system calls.
-
-        Args:
-            file_path: Path to the file
-
-        Returns:
-            os.stat_result or None if stat fails
-        """
-        if file_path not in self._file_stats_cache:
-            try:
-                self._file_stats_cache[file_path] = file_path.stat()
-            except OSError as e:
-                logger.error(f"Error accessing {file_path}: {e}")
-                return None
-        return self._file_stats_cache[file_path]
-
     @staticmethod
     def is_sensitive_file(file_path: Path | str) -> bool:
         """
@@ -712,16 +1526,7 @@ class ProjectConsolidator:
         Returns:
             True if file is sensitive, False otherwise
         """
-        # Accept either a Path or a string filename/path
-        if not isinstance(file_path, Path):
-            file_str = str(file_path)
-        else:
-            file_str = str(file_path)
-
-        for pattern in SENSITIVE_PATTERNS:
-            if re.search(pattern, file_str, re.IGNORECASE):
-                return True
-        return False
+        return FileWalker.is_sensitive_file(file_path)
 
     def analyze_sensitive_file(
         self,
@@ -749,20 +1554,18 @@ class ProjectConsolidator:
         # SECURITY NOTE: Key names can be sensitive (Issue #5)
         if file_path.name.startswith(".env") and self.list_env_keys:
             try:
-                with open(file_path, encoding="utf-8") as f:
-                    lines = f.readlines()
+                with open(file_path, "rb") as f:
+                    data = f.read(ENV_SCAN_MAX_BYTES)
 
                 keys = []
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key = line.split("=")[0].strip()
-                        # Redact middle portion of key name for security
-                        if len(key) > 8:
-                            redacted = f"{key[:4]}...{key[-2:]}={{Exists}}"
-                        else:
-                            redacted = f"{key}={{Exists}}"
-                        keys.append(redacted)
+                for match in _ENV_KEY_RE.finditer(data):
+                    key = match.group(1).decode("ascii")
+                    # Redact middle portion of key name for security
+                    if len(key) > 8:
+                        redacted = f"{key[:4]}...{key[-2:]}={{Exists}}"
+                    else:
+                        redacted = f"{key}={{Exists}}"
+                    keys.append(redacted)
 
                 info["keys"] = keys
             except OSError as e:
@@ -783,7 +1586,7 @@ class ProjectConsolidator:
         logger.info(f"Output:  {output_file}")
 
         git_info = self.git_info_provider.get_git_info()
-        timestamp = datetime.now()
+        timestamp = self.timestamp or datetime.now()
 
         try:
             # Store output file path for exclusion during processing
@@ -793,18 +1596,19 @@ class ProjectConsolidator:
                 # Fallback to the raw path if resolve() fails
                 self._output_file = output_file
 
-            with open(output_file, "w", encoding="utf-8") as out:
+            with open(output_file, "wb", buffering=OUTPUT_BUFFER_SIZE) as out:
                 # Write header
                 self.report_generator.write_header(out, timestamp, git_info)
 
-                # Write file tree
-                tree_lines = self.file_walker.build_file_tree(
-                    self.project_root
-                )
-                self.report_generator.write_file_tree(out, tree_lines)
+                # Walk the project once for both the tree and the files,
+                # streaming the tree into the report as it is built
+                report = self.report_generator
+                report.write_file_tree_header(out)
+                _, entries = self.file_walker.scan(out.write)
+                report.write_file_tree_footer(out)
 
-                # Walk through project
-                self._process_files(out)
+                # Write the files found by the walk
+                self._process_files(out, entries)
 
                 # Write statistics
                 self.report_generator.write_statistics(
@@ -821,92 +1625,213 @@ class ProjectConsolidator:
             logger.error(f"Error writing to output file {output_file}: {e}")
             raise
 
-    def _process_files(self, out) -> None:
-        """Process and write all files."""
-        self.report_generator.write_source_files_header(out)
-
-        for root, dirs, files in os.walk(self.project_root):
-            # Filter out excluded directories
-            dirs[:] = [
-                d for d in dirs if not self.file_walker.is_excluded_dir(d)
-            ]
+    def _collect_files(self, entries: List[Entry]) -> List[Entry]:
+        """
+        Select the files to write from the entries found by the walk.
 
-            root_path = Path(root)
+        Updates the total and excluded counters as it goes.
 
-            for file in sorted(files):
-                file_path = root_path / file
+        Args:
+            entries: Entries from FileWalker.scan
 
-                # Skip the consolidation script itself and output files
-                if file_path.name == Path(__file__).name:
-                    continue
-                # Skip any previously written consolidated output file
+        Returns:
+            Included entries in output order
+        """
+        included = []
+
+        # Bind loop invariants to locals once instead of per entry
+        append = included.append
+        basename = os.path.basename
+        script_name = SCRIPT_NAME
+        output_file = self._output_file
+        output_str = str(output_file) if output_file else None
+        output_name = output_file.name if output_file else None
+        total = excluded = 0
+
+        for entry in entries:
+            name = basename(entry.path)
+
+            # Skip the consolidation script itself and output files
+            if name == script_name:
+                continue
+            # Skip the output file being written. Only an entry with the
+            # same name can be it, so resolve() runs for those alone.
+            if name == output_name:
                 try:
                     if (
-                        self._output_file
-                        and file_path.resolve() == self._output_file
+                        entry.path == output_str
+                        or Path(entry.path).resolve() == output_file
                     ):
                         continue
                 except Exception:
-                    # If resolve fails, fall back to name-based pattern matching
-                    if OUTPUT_FILE_REGEX.match(file_path.name):
+                    # If resolve fails, fall back to name-based matching
+                    if OUTPUT_FILE_REGEX.match(name):
                         continue
 
-                self.stats["total_files"] += 1
+            total += 1
 
-                # Get file stat once and cache it (Issue #3 fix)
-                file_stat = self._get_file_stat(file_path)
-                if file_stat is None:
-                    self.stats["excluded_files"] += 1
-                    continue
+            if not entry.included:
+                excluded += 1
+                continue
 
-                file_size = file_stat.st_size
+            append(entry)
 
-                # Check if excluded (passing file_size to avoid redundant stat)
-                if self.file_walker.is_excluded_file(file_path, file_size):
-                    self.stats["excluded_files"] += 1
-                    continue
+        self.stats["total_files"] += total
+        self.stats["excluded_files"] += excluded
+        return included
 
-                # Check if sensitive
-                if self.is_sensitive_file(file_path):
-                    info = self.analyze_sensitive_file(
-                        file_path, self.list_env_keys
-                    )
-                    language = self.file_walker.get_file_language(file_path)
-                    self.report_generator.write_sensitive_file(
-                        out, file_path, file_stat, info, language
-                    )
-                    self.stats["sensitive_files"] += 1
-                    continue
+    def _process_files(self, out, entries: List[Entry]) -> None:
+        """
+        Process and write all files.
 
-                # Write regular file
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-
-                    lines = content.split("\n")
-                    line_count = len(lines)
-                    self.stats["total_lines"] += line_count
-
-                    language = self.file_walker.get_file_language(file_path)
-                    lang_stats = self.stats["languages"]
-                    lang_stats[language] = lang_stats.get(language, 0) + 1
-
-                    self.report_generator.write_regular_file(
-                        out,
-                        file_path,
-                        file_stat,
-                        content,
-                        line_count,
-                        language,
-                    )
-                    self.stats["included_files"] += 1
-                except (OSError, UnicodeDecodeError) as e:
-                    self.report_generator.write_error(
-                        out, file_path.relative_to(self.project_root), e
-                    )
+        Regular files up to PREFETCH_MAX_SIZE are read and rendered ahead by
+        a thread pool while this thread writes finished blocks in walk
+        order; at most PREFETCH_WINDOW files are in flight at once to bound
+        memory. Larger files are written directly when their turn comes.
+        """
+        # Imported here so the CLI does not load the pool machinery until
+        # there is work for it
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.report_generator.write_source_files_header(out)
+
+        files = self._collect_files(entries)
+        # No more than PREFETCH_WINDOW files are ever in flight, so extra
+        # workers beyond that would only sit idle
+        workers = min(PREFETCH_WINDOW, (os.cpu_count() or 1) * 4)
+
+        write_file = self._write_file
+        render_file = self._render_file
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            submit = executor.submit
+            pending = deque()
+            push, pop = pending.append, pending.popleft
+            for entry in files:
+                future = None
+                if not entry.is_sensitive and entry.size <= PREFETCH_MAX_SIZE:
+                    future = submit(render_file, entry)
+                push((entry, future))
+
+                if len(pending) >= PREFETCH_WINDOW:
+                    write_file(out, *pop())
+
+            while pending:
+                write_file(out, *pop())
 
         logger.info(f"Processed {self.stats['total_files']} files")
 
+    def _write_file(
+        self, out, entry: Entry, future: Optional["Future"]
+    ) -> None:
+        """
+        Write one included file to the output and update statistics.
+
+        Args:
+            out: Binary output stream
+            entry: Included entry from the walk
+            future: Pending render of the file by _render_file, or None to
+                    read it from disk now
+        """
+        # Relative path computed once, as a plain string, for all writers
+        rel_path = self.file_walker.relative_path(entry.path)
+        language = entry.language
+        stats = self.stats
+        report = self.report_generator
+
+        # Check if sensitive
+        if entry.is_sensitive:
+            info = self.analyze_sensitive_file(
+                Path(entry.path), self.list_env_keys
+            )
+            report.write_sensitive_file(
+                out, rel_path, entry.size, info, language
+            )
+            stats["sensitive_files"] += 1
+            return
+
+        # Write regular file. Prefetched files arrive fully rendered; large
+        # plain UTF-8 files are copied from a memory map.
+        try:
+            line_count = None
+            if future is not None:
+                parts, line_count = future.result()
+                report.write_rendered_file(out, rel_path, parts, line_count)
+            elif entry.size > MMAP_MIN_SIZE:
+                line_count = self._write_mapped(out, entry, rel_path)
+
+            if line_count is None:
+                # Anything else is decoded with replacement characters and
+                # universal newlines while streaming from disk
+                with open(entry.path, "rb") as raw:
+                    # Count lines in a first chunked pass, then rewind and
+                    # stream the content into the output
+                    line_count = _count_lines(raw)
+                    raw.seek(0)
+                    with io.TextIOWrapper(
+                        raw, encoding="utf-8", errors="replace"
+                    ) as source:
+                        report.write_regular_file(
+                            out,
+                            rel_path,
+                            entry.size,
+                            source,
+                            line_count,
+                            language,
+                        )
+
+            stats["total_lines"] += line_count
+            stats["languages"][language] += 1
+            stats["included_files"] += 1
+        except OSError as e:
+            report.write_error(out, rel_path, e)
+
+    def _render_file(self, entry: Entry) -> Tuple[List[bytes], int]:
+        """
+        Read and render one regular file (run on prefetch worker threads).
+
+        Args:
+            entry: Included, non-sensitive entry from the walk
+
+        Returns:
+            Tuple of (encoded parts to write in order, line count)
+        """
+        return self.report_generator.render_regular_file(
+            self.file_walker.relative_path(entry.path),
+            entry.size,
+            _read_file(entry.path, entry.size),
+            entry.language,
+        )
+
+    def _write_mapped(self, out, entry: Entry, rel_path: str) -> Optional[int]:
+        """
+        Write a large file by memory-mapping it (zero-copy fast path).
+
+        Args:
+            out: Binary output stream
+            entry: Included entry from the walk
+            rel_path: Path relative to the project root
+
+        Returns:
+            Line count of the written file, or None if the content needs
+            decoding and must go through the streaming path instead
+        """
+        with open(entry.path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty file (it shrank since the walk), or a filesystem
+                # that does not support mapping; stream it instead
+                return None
+            with mm:
+                line_count = _plain_utf8_line_count(mm)
+                if line_count is None:
+                    return None
+                self.report_generator.write_raw_file(
+                    out, rel_path, entry.size, mm, line_count, entry.language
+                )
+        return line_count
+
 
 def ensure_gitignore_entry(update_gitignore: bool = True) -> None:
     """
@@ -926,22 +1851,25 @@ def ensure_gitignore_entry(update_gitignore: bool = True) -> None:
     try:
         # Read existing .gitignore content
         if gitignore_path.exists():
-            with open(gitignore_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = gitignore_path.read_text(encoding="utf-8")
 
-            # Check if pattern already exists
-            if OUTPUT_FILE_PATTERN in content:
+            # Check if pattern already exists as its own line; a mention in
+            # a comment or a longer pattern does not count. Git ignores
+            # trailing spaces on a pattern line, so they are dropped here too.
+            present = frozenset(map(str.rstrip, content.splitlines()))
+            if OUTPUT_FILE_PATTERN in present:
                 logger.debug(
                     f".gitignore already contains {OUTPUT_FILE_PATTERN}"
                 )
                 return
 
-            # Append pattern
+            # Append pattern in a single write
+            separator = "\n" if content.endswith("\n") else "\n\n"
             with open(gitignore_path, "a", encoding="utf-8") as f:
-                if not content.endswith("\n"):
-                    f.write("\n")
-                f.write("\n# Exclude consolidated source files\n")
-                f.write(f"{OUTPUT_FILE_PATTERN}\n")
+                f.write(
+                    f"{separator}# Exclude consolidated source files\n"
+                    f"{OUTPUT_FILE_PATTERN}\n"
+                )
 
             logger.info(f"Added {OUTPUT_FILE_PATTERN} to .gitignore")
         else:
@@ -956,14 +1884,41 @@ def ensure_gitignore_entry(update_gitignore: bool = True) -> None:
         logger.warning(f"Could not update .gitignore: {e}")
 
 
+# Result of the first detect_project_root() call in this process
+_PROJECT_ROOT_CACHE: Optional[Path] = None
+
+
+def clear_project_root_cache() -> None:
+    """Forget the cached result of detect_project_root()."""
+    global _PROJECT_ROOT_CACHE
+    _PROJECT_ROOT_CACHE = None
+
+
 def detect_project_root() -> Path:
     """
     Detect the project root directory by looking for common markers.
 
+    The result is cached for the life of the process; call
+    clear_project_root_cache() to detect again.
+
     Returns:
         Path to detected project root, or script directory as fallback
     """
-    current = Path(__file__).parent.absolute()
+    global _PROJECT_ROOT_CACHE
+    if _PROJECT_ROOT_CACHE is None:
+        _PROJECT_ROOT_CACHE = _find_project_root()
+    return _PROJECT_ROOT_CACHE
+
+
+def _find_project_root() -> Path:
+    """
+    Walk up from the script directory to the first project root marker.
+
+    Returns:
+        Path to detected project root, or script directory as fallback
+    """
+    script_dir = Path(__file__).parent.absolute()
+    current = script_dir
 
     # Common project root markers
     root_markers = {
@@ -979,33 +1934,59 @@ def detect_project_root() -> Path:
 
     # Walk up the directory tree looking for markers
     while current.parent != current:
-        # Check if any marker exists in current directory
-        for marker in root_markers:
-            if (current / marker).exists():
-                logger.debug(f"Detected project root via {marker}: {current}")
-                return current
+        # One directory listing per ancestor instead of a stat per marker
+        try:
+            with os.scandir(current) as it:
+                found = root_markers.intersection(entry.name for entry in it)
+        except OSError:
+            found = None
+        if found:
+            marker = min(found)
+            logger.debug(f"Detected project root via {marker}: {current}")
+            return current
 
         # Move up one level
         current = current.parent
 
     # Fallback to script directory
-    fallback = Path(__file__).parent.absolute()
+    fallback = script_dir
     logger.debug(
         f"No project root markers found, using script directory: {fallback}"
     )
     return fallback
 
 
-def parse_arguments() -> argparse.Namespace:
+def _positive_int(value: str) -> int:
     """
-    Parse command line arguments.
+    Parse a command line value as an integer of at least 1.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"expected a positive integer, got {value!r}"
+        )
+    return number
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser once per process.
 
     Returns:
-        Parsed arguments namespace
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(
         description="Consolidate project source code into a single file.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
+        # Options must be spelled out; abbreviations like --verb are refused
+        allow_abbrev=False,
         epilog="""
 Examples:
   %(prog)s                          # Run with defaults
@@ -1045,6 +2026,19 @@ Examples:
         help="Don't list .env file keys (more secure)",
     )
 
+    parser.add_argument(
+        "--follow-symlinks",
+        action="store_true",
+        help="Follow symbolic links (skipped by default)",
+    )
+
+    parser.add_argument(
+        "--max-depth",
+        type=_positive_int,
+        help="Only descend this many directory levels (default: no limit)",
+        metavar="N",
+    )
+
     parser.add_argument(
         "--max-file-size",
         type=int,
@@ -1062,7 +2056,17 @@ Examples:
         version="%(prog)s 2.1 (with audit fixes)",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Parsed arguments namespace
+    """
+    return _build_parser().parse_args()
 
 
 def main() -> int:
@@ -1081,7 +2085,8 @@ def main() -> int:
 
     # Determine project root
     if args.project_root:
-        project_root = args.project_root.absolute()
+        # abspath also collapses ".." so the root has a usable name
+        project_root = Path(os.path.abspath(args.project_root))
     else:
         project_root = detect_project_root()
 
@@ -1090,11 +2095,13 @@ def main() -> int:
         logger.error(f"Project root does not exist: {project_root}")
         return 1
 
+    # One timestamp for the whole run: output file name and report
+    timestamp = datetime.now()
+
     # Generate output filename if not provided
     if args.output:
         output_path = args.output
     else:
-        timestamp = datetime.now()
         project_name = project_root.name.replace(" ", "_").lower()
         date_str = timestamp.strftime("%Y%m%d_%H%M")
         output_filename = f"{project_name}_{date_str}_merged_sources.txt"
@@ -1115,7 +2122,11 @@ def main() -> int:
 
     # Create consolidator with options
     consolidator = ProjectConsolidator(
-        project_root, list_env_keys=not args.no_list_env_keys
+        project_root,
+        list_env_keys=not args.no_list_env_keys,
+        follow_symlinks=args.follow_symlinks,
+        max_depth=args.max_depth,
+        timestamp=timestamp,
     )
 
     # Run consolidation
@@ -1145,11 +2156,7 @@ def main() -> int:
         )
 
         logger.info("\nTop Languages:")
-        sorted_langs = sorted(
-            consolidator.stats["languages"].items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )[:5]
+        sorted_langs = Counter(consolidator.stats["languages"]).most_common(5)
         for lang, count in sorted_langs:
             logger.info(f"  {lang:20s} {count:4d} files")
 
@@ -45,3 +45,15 @@ def consolidator_factory() -> Generator:
         return ProjectConsolidator(root_path)
 
     yield _factory
+
+
+@pytest.fixture(autouse=True)
+def fresh_project_root_cache() -> Generator[None, None, None]:
+    """
+    Clears the detect_project_root cache so each test detects afresh.
+    """
+    from consolidate_project_sources import clear_project_root_cache
+
+    clear_project_root_cache()
+    yield
+    clear_project_root_cache()
@@ -3,10 +3,16 @@ Tests for the command-line interface and main entry point of the script.
 """
 
 import subprocess
+from contextlib import nullcontext
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
-from consolidate_project_sources import (GitInfoProvider, detect_project_root,
+import pytest
+
+import consolidate_project_sources
+from consolidate_project_sources import (GitInfoProvider,
+                                         clear_project_root_cache,
+                                         detect_project_root,
                                          ensure_gitignore_entry, main,
                                          parse_arguments)
 
@@ -20,6 +26,8 @@ def test_parse_arguments_defaults():
         assert not args.verbose
         assert not args.no_update_gitignore
         assert not args.no_list_env_keys
+        assert not args.follow_symlinks
+        assert args.max_depth is None
 
 
 def test_parse_arguments_custom_args():
@@ -35,6 +43,8 @@ def test_parse_arguments_custom_args():
             "--verbose",
             "--no-update-gitignore",
             "--no-list-env-keys",
+            "--max-depth",
+            "2",
         ],
     ):
         args = parse_arguments()
@@ -43,6 +53,7 @@ def test_parse_arguments_custom_args():
         assert args.verbose
         assert args.no_update_gitignore
         assert args.no_list_env_keys
+        assert args.max_depth == 2
 
 
 @patch("consolidate_project_sources.ProjectConsolidator")
@@ -114,7 +125,11 @@ def test_main_autodetect_root(
     assert exit_code == 0
     mock_detect_root.assert_called_once()
     mock_consolidator_class.assert_called_with(
-        Path("/fake/project"), list_env_keys=True
+        Path("/fake/project"),
+        list_env_keys=True,
+        follow_symlinks=False,
+        max_depth=None,
+        timestamp=ANY,
     )
 
 
@@ -130,13 +145,16 @@ def test_get_git_info_fails_gracefully(mock_subprocess):
     assert git_info["branch"] == "unknown"
 
 
-@patch("pathlib.Path.exists", return_value=False)
-def test_detect_project_root_fallback(mock_exists):
+@patch(
+    "consolidate_project_sources.os.scandir",
+    side_effect=lambda _path: nullcontext(iter(())),
+)
+def test_detect_project_root_fallback(mock_scandir):
     """Test that detect_project_root falls back to the script's directory."""
-    # This test is tricky because it depends on the test runner's location.
-    # We'll just ensure it returns *a* path without erroring.
+    # No directory on the way up lists any marker
     fallback_path = detect_project_root()
-    assert isinstance(fallback_path, Path)
+    assert mock_scandir.called
+    assert fallback_path == Path(consolidate_project_sources.__file__).parent
 
 
 def test_detect_project_root(tmp_path):
@@ -158,6 +176,14 @@ def test_detect_project_root(tmp_path):
             detected = detect_project_root()
             assert detected == project_root
 
+    # The cached result is returned without walking the tree again
+    with patch(
+        "consolidate_project_sources.os.scandir", side_effect=AssertionError
+    ):
+        assert detect_project_root() is detected
+    clear_project_root_cache()
+    assert detect_project_root() != project_root
+
 
 def test_ensure_gitignore_entry(tmp_path):
     """Test that ensure_gitignore_entry correctly updates or creates .gitignore."""
@@ -177,3 +203,55 @@ def test_ensure_gitignore_entry(tmp_path):
         content = gitignore.read_text()
         assert "initial content" in content
         assert "*_merged_sources*.txt" in content
+
+
+@patch(
+    "subprocess.check_output",
+    return_value=(
+        "0123456789abcdef\x002025-10-18 12:00:00 +0000\x00"
+        "HEAD -> main, origin/main, tag: v2.1"
+    ),
+)
+def test_get_git_info_single_command(mock_subprocess):
+    """Test that get_git_info parses hash, date and branch from one call."""
+    git_provider = GitInfoProvider(Path("."))
+    git_info = git_provider.get_git_info()
+    assert git_provider.get_git_info() is git_info
+    mock_subprocess.assert_called_once()
+    assert git_info == {
+        "commit": "01234567",
+        "date": "2025-10-18 12:00:00 +0000",
+        "branch": "main",
+    }
+
+
+def test_ensure_gitignore_entry_ignores_comment_mentions(tmp_path):
+    """Test that a pattern mentioned only in a comment is still appended."""
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("# see *_merged_sources*.txt\n")
+
+    with patch("consolidate_project_sources.PROJECT_ROOT", tmp_path):
+        ensure_gitignore_entry(update_gitignore=True)
+        lines = gitignore.read_text().splitlines()
+        assert "*_merged_sources*.txt" in lines
+
+        # A second run finds the line and leaves the file alone
+        ensure_gitignore_entry(update_gitignore=True)
+        assert gitignore.read_text().splitlines() == lines
+
+
+def test_ensure_gitignore_entry_ignores_trailing_spaces(tmp_path):
+    """Test that a pattern line with trailing spaces counts as present."""
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("*.log\n*_merged_sources*.txt  \n")
+
+    with patch("consolidate_project_sources.PROJECT_ROOT", tmp_path):
+        ensure_gitignore_entry(update_gitignore=True)
+        assert gitignore.read_text() == "*.log\n*_merged_sources*.txt  \n"
+
+
+def test_parse_arguments_rejects_abbreviations():
+    """Test that abbreviated option names are not accepted."""
+    with patch("sys.argv", ["script.py", "--verb"]):
+        with pytest.raises(SystemExit):
+            parse_arguments()
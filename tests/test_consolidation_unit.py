@@ -1,7 +1,8 @@
 """
-Unit tests for FileWalker.is_excluded_dir.
+Unit tests for FileWalker.is_excluded_dir, scan and build_file_tree.
 """
 
+import os
 from pathlib import Path
 
 import pytest
@@ -26,3 +27,129 @@ def test_is_excluded_dir_parametrized(dirname: str, expected: bool):
     """
     file_walker = FileWalker(Path("."))
     assert file_walker.is_excluded_dir(dirname) is expected
+
+
+@pytest.mark.parametrize(
+    "dirname,rel_path,expected",
+    [
+        ("__pycache__", "migrations/__pycache__", True),
+        ("migrations", "migrations", False),
+        ("cache", "app/migrations/cache", False),
+        ("node_modules", "web/node_modules", True),
+    ],
+)
+def test_is_excluded_dir_rel_path(dirname: str, rel_path: str, expected: bool):
+    """
+    Test is_excluded_dir matches path entries of EXCLUDE_DIRS by rel_path.
+    """
+    file_walker = FileWalker(Path("."))
+    assert file_walker.is_excluded_dir(dirname, rel_path) is expected
+
+
+@pytest.mark.parametrize("follow_symlinks", [False, True])
+def test_scan_symlinks(tmp_path: Path, follow_symlinks: bool):
+    """
+    Test that symlinks are skipped by default and that following them
+    does not loop forever on a cycle.
+    """
+    (tmp_path / "real.py").write_text("x = 1\n")
+    (tmp_path / "link.py").symlink_to(tmp_path / "real.py")
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+    file_walker = FileWalker(tmp_path, follow_symlinks=follow_symlinks)
+    _, entries = file_walker.scan()
+    names = sorted(os.path.basename(entry.path) for entry in entries)
+    if follow_symlinks:
+        assert names == ["link.py", "real.py"]
+    else:
+        assert names == ["real.py"]
+
+
+def test_build_file_tree_matches_scan(tmp_path: Path):
+    """
+    Test build_file_tree renders the same tree as scan, directories first.
+    """
+    (tmp_path / "b.py").write_text("b = 1\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("a = 1\n")
+    (tmp_path / "node_modules").mkdir()
+
+    file_walker = FileWalker(tmp_path)
+    tree_lines = file_walker.build_file_tree(tmp_path)
+    assert tree_lines == file_walker.scan()[0]
+    assert (
+        b"".join(tree_lines).decode() == "├── pkg/\n│   └── a.py\n└── b.py\n"
+    )
+
+
+def test_scan_max_depth(tmp_path: Path):
+    """
+    Test that directories below max_depth are listed but not walked.
+    """
+    (tmp_path / "top.py").write_text("t = 1\n")
+    deep = tmp_path / "pkg" / "sub"
+    deep.mkdir(parents=True)
+    (tmp_path / "pkg" / "a.py").write_text("a = 1\n")
+    (deep / "b.py").write_text("b = 1\n")
+
+    file_walker = FileWalker(tmp_path, max_depth=2)
+    tree_lines, entries = file_walker.scan()
+    names = sorted(os.path.basename(entry.path) for entry in entries)
+    assert names == ["a.py", "top.py"]
+    assert b"".join(tree_lines).decode() == (
+        "├── pkg/\n│   ├── sub/\n│   └── a.py\n└── top.py\n"
+    )
+
+
+def test_scan_deep_tree_within_fd_limit(tmp_path: Path):
+    """
+    Test that a tree deeper than the open-file limit is walked completely.
+    """
+    resource = pytest.importorskip("resource")
+    deep = tmp_path.joinpath(*["d"] * 300)
+    deep.mkdir(parents=True)
+    (deep / "leaf.py").write_text("x = 1\n")
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(128, hard), hard))
+    try:
+        _, entries = FileWalker(tmp_path).scan()
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+    assert [entry.path for entry in entries] == [str(deep / "leaf.py")]
+
+
+def test_scan_falls_back_to_paths_without_descriptors(
+    tmp_path: Path, monkeypatch
+):
+    """
+    Test that subtrees are listed by path when no descriptors are left.
+    """
+    import errno
+
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "pkg" / "sub" / "a.py").write_text("a = 1\n")
+    os_open = os.open
+
+    def exhausted_open(path, flags, *args, dir_fd=None, **kwargs):
+        if dir_fd is not None:
+            raise OSError(errno.EMFILE, "Too many open files")
+        return os_open(path, flags, *args, **kwargs)
+
+    monkeypatch.setattr(os, "open", exhausted_open)
+    _, entries = FileWalker(tmp_path).scan()
+    assert [os.path.basename(entry.path) for entry in entries] == ["a.py"]
+
+
+def test_scan_reports_missing_root_neutrally(tmp_path: Path, caplog):
+    """
+    Test that errors other than permission problems are not reported as
+    "Permission denied".
+    """
+    file_walker = FileWalker(tmp_path / "gone")
+    with caplog.at_level("WARNING"):
+        assert file_walker.scan() == ([], [])
+    assert "Cannot list" in caplog.text
+    assert "Permission denied" not in caplog.text
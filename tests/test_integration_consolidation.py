@@ -10,6 +10,8 @@ def test_full_consolidation_workflow(dummy_project, consolidator_factory):
     """
     Test the end-to-end consolidation process.
     """
+    # Old Mac line endings: three lines, written with "\n"
+    (dummy_project / "mac.txt").write_bytes(b"m1\rm2\rm3\r")
     consolidator = consolidator_factory(dummy_project)
     output_path = dummy_project / "consolidated.txt"
     consolidator.consolidate(output_path)
@@ -23,6 +25,117 @@ def test_full_consolidation_workflow(dummy_project, consolidator_factory):
     )
     # Excluded file not present
     assert "react mock" not in output  # node_modules/react.js
+    # Line counts: a final line without a newline still counts
+    assert "Lines:      1\n" in output  # app.py
+    # Lines ended by a lone "\r" are counted as they are written
+    mac_block = output.split("FILE: mac.txt\n", 1)[1]
+    assert "Lines:      3\n" in mac_block.split("m1", 1)[0]
+    assert "\nm1\nm2\nm3\n" in mac_block
     # Statistics
-    assert "Files Included: 3" in output
+    assert "Files Included: 4" in output
     assert "Sensitive Files: 1" in output
+
+
+@pytest.mark.integration
+def test_large_files_consolidation(
+    tmp_path, monkeypatch, consolidator_factory
+):
+    """
+    Test large files give the same output whether they are memory-mapped
+    (plain UTF-8) or decoded (CRLF line endings).
+    """
+    from consolidate_project_sources import MMAP_MIN_SIZE, ReportGenerator
+
+    plain_line = "x = 'é'\n".encode()
+    crlf_line = "y = 'é'\r\n".encode()
+    # Enough lines to put both files over the memory-mapping threshold
+    repeats = MMAP_MIN_SIZE // len(plain_line) + 1
+    (tmp_path / "plain.py").write_bytes(plain_line * repeats)
+    (tmp_path / "crlf.py").write_bytes(crlf_line * repeats)
+
+    mapped = []
+    write_raw_file = ReportGenerator.write_raw_file
+
+    def record_raw_write(self, out, rel_path, *args):
+        mapped.append(rel_path)
+        write_raw_file(self, out, rel_path, *args)
+
+    monkeypatch.setattr(ReportGenerator, "write_raw_file", record_raw_write)
+    output_path = tmp_path / "consolidated.txt"
+    consolidator_factory(tmp_path).consolidate(output_path)
+    output = output_path.read_text(encoding="utf-8")
+
+    # Only the plain UTF-8 file is copied from the memory map
+    assert mapped == ["plain.py"]
+    assert output.count(f"Lines:      {repeats}\n") == 2
+    assert output.count("x = 'é'\n") == repeats
+    assert output.count("y = 'é'\n") == repeats
+    assert "\r" not in output
+    assert "Files Included: 2" in output
+
+
+@pytest.mark.integration
+def test_consolidation_uses_given_timestamp(dummy_project):
+    """
+    Test the report is stamped with the timestamp passed by the caller.
+    """
+    from datetime import datetime
+
+    from consolidate_project_sources import ProjectConsolidator
+
+    timestamp = datetime(2024, 1, 2, 3, 4, 5)
+    consolidator = ProjectConsolidator(dummy_project, timestamp=timestamp)
+    output_path = dummy_project / "consolidated.txt"
+    consolidator.consolidate(output_path)
+    output = output_path.read_text()
+    assert output.count("2024-01-02 03:04:05") == 2  # header and statistics
+
+
+@pytest.mark.integration
+def test_large_file_streams_when_mmap_fails(
+    tmp_path, monkeypatch, consolidator_factory
+):
+    """
+    Test a file that cannot be memory-mapped is streamed, not reported as
+    unreadable.
+    """
+    import errno
+    import mmap
+
+    from consolidate_project_sources import MMAP_MIN_SIZE
+
+    def no_mmap(*_args, **_kwargs):
+        raise OSError(errno.ENODEV, "No such device")
+
+    monkeypatch.setattr(mmap, "mmap", no_mmap)
+    repeats = MMAP_MIN_SIZE // 6 + 1
+    (tmp_path / "big.py").write_bytes(b"x = 1\n" * repeats)
+    output_path = tmp_path / "consolidated.txt"
+    consolidator_factory(tmp_path).consolidate(output_path)
+    output = output_path.read_text(encoding="utf-8")
+
+    assert "ERROR" not in output
+    assert f"Lines:      {repeats}\n" in output
+    assert output.count("x = 1\n") == repeats
+
+
+@pytest.mark.integration
+def test_short_reads_are_completed(
+    tmp_path, monkeypatch, consolidator_factory
+):
+    """
+    Test files are written in full when os.read returns fewer bytes than
+    asked for.
+    """
+    import os
+
+    content = "".join(f"line {i}\n" for i in range(100))
+    (tmp_path / "small.py").write_text(content)
+    read = os.read
+    monkeypatch.setattr(os, "read", lambda fd, n: read(fd, min(n, 7)))
+    output_path = tmp_path / "consolidated.txt"
+    consolidator_factory(tmp_path).consolidate(output_path)
+    output = output_path.read_text(encoding="utf-8")
+
+    assert content in output
+    assert "Lines:      100\n" in output
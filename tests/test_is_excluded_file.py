@@ -1,12 +1,13 @@
 """
-Unit tests for FileWalker.is_excluded_file.
+Unit tests for FileWalker.is_excluded_file and FileWalker.classify.
 """
 
+import os
 from pathlib import Path
 
 import pytest
 
-from consolidate_project_sources import FileWalker
+from consolidate_project_sources import FileWalker, _glob_regex
 
 
 @pytest.mark.parametrize(
@@ -30,3 +31,90 @@ def test_is_excluded_file_parametrized(
     monkeypatch.setattr("os.path.getsize", lambda _: size)
     result = file_walker.is_excluded_file(filename)
     assert result is expected, f"{filename}: {reason}"
+
+
+@pytest.mark.parametrize(
+    "filename,content,included,sensitive,language",
+    [
+        ("main.py", b"print('hi')\n", True, False, "Python"),
+        ("logo.png", b"\x89PNG", False, False, ""),
+        ("blob.bin", b"\xff\xfe\x00\x01", False, False, ""),
+        ("frames.dat", b"\x1b\x02\x03\x04ab", False, False, ""),
+        ("notes.dat", b"plain words\n\x1b[0m\n", True, False, "Text"),
+        ("empty.dat", b"", True, False, "Text"),
+        (".env", b"KEY=value\n", True, True, "Text"),
+        ("server.key", b"0\x82\x01\x00\x02", False, True, ""),
+        ("README.md", b"# Title\n", True, False, "Markdown"),
+    ],
+)
+def test_classify_entry(
+    tmp_path, filename, content, included, sensitive, language
+):
+    """
+    Test classify returns the inclusion decision, sensitivity and language.
+    """
+    (tmp_path / filename).write_bytes(content)
+    file_walker = FileWalker(tmp_path)
+    with os.scandir(tmp_path) as it:
+        entry = next(it)
+    result = file_walker.classify(entry)
+    # The walk and is_excluded_file apply the same rules
+    assert file_walker.is_excluded_file(entry) is not included
+    assert result.included is included
+    assert result.is_sensitive is sensitive
+    assert result.language == language
+    if included:
+        assert result.size == len(content)
+
+
+def test_is_excluded_file_known_size_skips_probe(monkeypatch):
+    """
+    Test an oversized file with a known size is rejected without a text probe.
+    """
+
+    def fail(*_args):
+        raise AssertionError("text probe should not run")
+
+    monkeypatch.setattr(FileWalker, "is_text_file", staticmethod(fail))
+    monkeypatch.setattr("os.path.getsize", fail)
+    file_walker = FileWalker(Path("."))
+    assert file_walker.is_excluded_file("blob.unknown", 10_000_000) is True
+
+
+@pytest.mark.parametrize(
+    "filename,content,expected",
+    [
+        ("main.py", b"x = 1\n", False),
+        ("module.pyc", b"\x00\x01", True),
+        ("data.json", b"{}", False),
+    ],
+)
+def test_is_excluded_file_dir_entry(
+    tmp_path, monkeypatch, filename, content, expected
+):
+    """
+    Test is_excluded_file takes the size of an os.DirEntry from its stat.
+    """
+    (tmp_path / filename).write_bytes(content)
+
+    def fail(_path):
+        raise AssertionError("DirEntry size should not be re-statted")
+
+    monkeypatch.setattr("os.path.getsize", fail)
+    file_walker = FileWalker(tmp_path)
+    with os.scandir(tmp_path) as it:
+        entry = next(it)
+    assert file_walker.is_excluded_file(entry) is expected
+
+
+def test_glob_regex():
+    """
+    Test the glob regex matches its patterns and that an empty pattern set
+    matches nothing rather than everything.
+    """
+    regex = _glob_regex({"*.min.js", "*.map"})
+    assert regex.match("app.min.js")
+    assert regex.match("app.js.map")
+    assert not regex.match("app.js")
+    assert not _glob_regex(set()).match("main.py")
+    assert not _glob_regex(set()).match("")
@@ -2,6 +2,8 @@
 Unit tests for sensitive file detection and language mapping.
 """
 
+import os
+
 import pytest
 
 from consolidate_project_sources import FileWalker, ProjectConsolidator
@@ -25,12 +27,30 @@ def test_is_sensitive_file(filename, expected):
     assert ProjectConsolidator.is_sensitive_file(filename) is expected
 
 
+def test_classify_sensitive_uses_relative_path(tmp_path):
+    """
+    Test that directories above the project root do not mark files sensitive.
+    """
+    project = tmp_path / "secrets" / "app"
+    (project / "config").mkdir(parents=True)
+    (project / "main.py").write_text("x = 1\n")
+    (project / "config" / "credentials.yml").write_text("user: me\n")
+
+    file_walker = FileWalker(project)
+    _, entries = file_walker.scan()
+    sensitive = {
+        os.path.basename(entry.path): entry.is_sensitive for entry in entries
+    }
+    assert sensitive == {"main.py": False, "credentials.yml": True}
+
+
 @pytest.mark.parametrize(
     "filename,expected",
     [
         ("main.py", "Python"),
         ("app.js", "JavaScript"),
         ("Dockerfile", "Docker"),
+        ("Makefile", "Makefile"),
         ("file.unknown", "Text"),  # or None, depending on implementation
     ],
 )
@@ -40,3 +60,21 @@ def test_get_file_language(filename, expected):
     """
     result = FileWalker.get_file_language(filename)
     assert result == expected
+
+
+def test_analyze_sensitive_file_lists_redacted_keys(tmp_path):
+    """
+    Test that .env key names are extracted, redacted, and values omitted.
+    """
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# comment=ignored\n"
+        "SHORT=1\n"
+        "  export DATABASE_URL = postgres://user:pw@host/db\n"
+        "\n"
+        "not a key line\n"
+    )
+    consolidator = ProjectConsolidator(tmp_path)
+    info = consolidator.analyze_sensitive_file(env_file)
+    assert info["keys"] == ["SHORT={Exists}", "DATA...RL={Exists}"]
+    assert "postgres" not in str(info)